@@ -1,8 +1,12 @@
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
+import asyncio
 import random
+import time
 import numpy as np
 import logging
 
@@ -119,6 +123,59 @@ class MockStockResponse(BaseModel):
     pe_ratio: float
     timestamp: str
 
+class BatchOperation(BaseModel):
+    id: Optional[str] = None
+    type: str = Field(..., pattern="^(predict|indicators|sentiment)$")
+    symbol: Optional[str] = Field(default=None, min_length=1, max_length=10)
+    days_to_predict: int = Field(default=7, ge=1, le=30)
+    texts: Optional[List[str]] = None
+
+class BatchRequest(BaseModel):
+    series: Dict[str, List[List[float]]] = {}  # OHLCV data keyed by symbol, shared by all operations
+    operations: List[BatchOperation] = Field(..., min_items=1, max_items=100)
+    timeout_ms: int = Field(default=10000, ge=100, le=60000)
+    stream: bool = False
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "series": {
+                    "AAPL": [
+                        [150.0, 155.0, 148.0, 152.0, 1000000],
+                        [152.0, 158.0, 150.0, 155.0, 1200000],
+                        [155.0, 160.0, 153.0, 158.0, 1100000],
+                        [158.0, 162.0, 156.0, 160.0, 1300000],
+                        [160.0, 165.0, 158.0, 162.0, 1400000]
+                    ]
+                },
+                "operations": [
+                    {"id": "aapl-lstm", "type": "predict", "symbol": "AAPL", "days_to_predict": 7},
+                    {"id": "aapl-news", "type": "sentiment", "symbol": "AAPL",
+                     "texts": ["Apple reports record quarterly earnings"]}
+                ],
+                "timeout_ms": 5000,
+                "stream": False
+            }
+        }
+
+class BatchResult(BaseModel):
+    id: str
+    type: str
+    symbol: Optional[str]
+    status: str  # "ok", "error" or "timeout"
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+class BatchResponse(BaseModel):
+    results: List[BatchResult]
+    total_operations: int
+    unique_operations: int
+    succeeded: int
+    failed: int
+    timed_out: int
+    elapsed_ms: int
+    generated_at: str
+
 # ============ Helper Functions ============
 
 def calculate_technical_indicators(data: List[List[float]]) -> Dict[str, Any]:
@@ -201,6 +258,186 @@ def analyze_keywords(text: str) -> List[str]:
     
     return found
 
+def run_lstm_prediction(symbol: str, features: List[List[float]], days_to_predict: int) -> PredictionResponse:
+    """Generate an LSTM-style price forecast from OHLCV features"""
+    logger.info(f"Prediction request for {symbol}")
+    
+    if not features or len(features) < 5:
+        raise HTTPException(
+            status_code=400, 
+            detail="At least 5 data points required for prediction"
+        )
+    
+    # Extract data
+    last_price = features[-1][3]  # close price
+    recent_data = features[-10:]  # last 10 days
+    
+    # Calculate volatility from historical data
+    closes = [d[3] for d in recent_data]
+    returns = [(closes[i] - closes[i-1]) / closes[i-1] for i in range(1, len(closes))]
+    volatility = np.std(returns) if returns else 0.02
+    
+    # Determine trend based on momentum
+    sma_5 = np.mean(closes[-5:]) if len(closes) >= 5 else last_price
+    sma_10 = np.mean(closes[-10:]) if len(closes) >= 10 else last_price
+    
+    if sma_5 > sma_10 * 1.01:
+        base_trend = 0.001  # Slight upward bias
+        trend_name = "bullish"
+    elif sma_5 < sma_10 * 0.99:
+        base_trend = -0.001  # Slight downward bias
+        trend_name = "bearish"
+    else:
+        base_trend = 0.0
+        trend_name = "neutral"
+    
+    # Generate predictions with mean reversion and momentum
+    predictions = []
+    confidence_scores = []
+    current_price = last_price
+    
+    for day in range(days_to_predict):
+        # Random walk with drift
+        random_component = random.gauss(0, volatility)
+        drift = base_trend * (1 - day * 0.05)  # Decaying momentum
+        
+        # Mean reversion factor (prices tend to revert to mean)
+        mean_price = np.mean(closes)
+        reversion_strength = 0.02 * (day / days_to_predict)
+        reversion = (mean_price - current_price) / current_price * reversion_strength
+        
+        total_change = drift + random_component + reversion
+        current_price *= (1 + total_change)
+        
+        predictions.append(round(max(current_price, 0.01), 2))
+        
+        # Confidence decreases with prediction horizon
+        confidence = max(0.45, 0.92 - (day * 0.06))
+        confidence_scores.append(round(confidence, 2))
+    
+    # Calculate statistics
+    price_change = ((predictions[-1] - last_price) / last_price) * 100
+    predicted_high = max(predictions)
+    predicted_low = min(predictions)
+    
+    # Refine trend based on final prediction
+    if price_change > 3:
+        trend_name = "bullish"
+    elif price_change < -3:
+        trend_name = "bearish"
+    
+    logger.info(f"Prediction complete for {symbol}: {trend_name}")
+    
+    return PredictionResponse(
+        symbol=symbol.upper(),
+        predictions=predictions,
+        confidence_scores=confidence_scores,
+        trend=trend_name,
+        current_price=round(last_price, 2),
+        predicted_change_percent=round(price_change, 2),
+        predicted_high=round(predicted_high, 2),
+        predicted_low=round(predicted_low, 2),
+        generated_at=datetime.now().isoformat(),
+        model_version="lstm-cloud-v1.0"
+    )
+
+def run_sentiment_analysis(texts: List[str], symbol: Optional[str] = None) -> SentimentResponse:
+    """Score financial news texts and aggregate them into an overall sentiment"""
+    logger.info(f"Sentiment analysis for {symbol or 'general'}")
+    
+    if not texts:
+        raise HTTPException(status_code=400, detail="No texts provided")
+    
+    sentiments = []
+    total_score = 0
+    bullish_count = 0
+    bearish_count = 0
+    neutral_count = 0
+    
+    for text in texts:
+        text_lower = text.lower()
+        keywords = analyze_keywords(text)
+        
+        # Scoring system
+        positive_score = sum(1 for k in keywords if k in ["profit", "growth", "surge", "bull", "rally", "gain", "record", "beat", "strong", "outperform"])
+        negative_score = sum(1 for k in keywords if k in ["loss", "crash", "bear", "decline", "drop", "weak", "miss", "recession", "underperform", "fall"])
+        
+        # Calculate sentiment score (-1 to 1)
+        if positive_score > negative_score:
+            label = "positive"
+            score = min(0.95, 0.6 + (positive_score - negative_score) * 0.1)
+            bullish_count += 1
+        elif negative_score > positive_score:
+            label = "negative"
+            score = min(0.95, 0.6 + (negative_score - positive_score) * 0.1)
+            bearish_count += 1
+        else:
+            label = "neutral"
+            score = 0.5
+            neutral_count += 1
+        
+        # Adjust score sign based on label
+        sentiment_value = score if label == "positive" else -score if label == "negative" else 0
+        total_score += sentiment_value
+        
+        sentiments.append(SentimentItem(
+            text=text[:100] + "..." if len(text) > 100 else text,
+            label=label,
+            score=round(score, 3),
+            keywords=keywords
+        ))
+    
+    # Calculate overall metrics
+    avg_score = total_score / len(texts)
+    
+    if avg_score > 0.25:
+        overall_label = "positive"
+        recommendation = "buy"
+    elif avg_score < -0.25:
+        overall_label = "negative"
+        recommendation = "sell"
+    else:
+        overall_label = "neutral"
+        recommendation = "hold"
+    
+    confidence = abs(avg_score)
+    
+    return SentimentResponse(
+        symbol=symbol.upper() if symbol else None,
+        sentiments=sentiments,
+        overall_score=round(avg_score, 3),
+        overall_label=overall_label,
+        recommendation=recommendation,
+        confidence=round(confidence, 3),
+        bullish_count=bullish_count,
+        bearish_count=bearish_count,
+        neutral_count=neutral_count
+    )
+
+def batch_operation_key(op: BatchOperation) -> Tuple:
+    """Identity of a batch operation, used to run identical operations only once"""
+    symbol = op.symbol.upper() if op.symbol else None
+    if op.type == "predict":
+        return (op.type, symbol, op.days_to_predict)
+    if op.type == "sentiment":
+        return (op.type, symbol, tuple(op.texts or []))
+    return (op.type, symbol)
+
+def run_batch_operation(op: BatchOperation, series: Dict[str, List[List[float]]]) -> Dict[str, Any]:
+    """Execute a single batch operation against the shared OHLCV series"""
+    if op.type == "sentiment":
+        return run_sentiment_analysis(op.texts or [], op.symbol).model_dump()
+    
+    if not op.symbol:
+        raise HTTPException(status_code=400, detail=f"'{op.type}' operation requires a symbol")
+    data = series.get(op.symbol.upper())
+    if data is None:
+        raise HTTPException(status_code=400, detail=f"No series provided for {op.symbol.upper()}")
+    
+    if op.type == "predict":
+        return run_lstm_prediction(op.symbol, data, op.days_to_predict).model_dump()
+    return TechnicalIndicatorResponse(**calculate_technical_indicators(data)).model_dump()
+
 # ============ API Endpoints ============
 
 @router.get("/health", response_model=HealthResponse, tags=["Health"])
@@ -223,86 +460,7 @@ async def predict_lstm(request: PredictionRequest):
     For demo purposes, uses sophisticated mock logic that mimics real ML behavior.
     """
     try:
-        logger.info(f"Prediction request for {request.symbol}")
-        
-        if not request.features or len(request.features) < 5:
-            raise HTTPException(
-                status_code=400, 
-                detail="At least 5 data points required for prediction"
-            )
-        
-        # Extract data
-        last_price = request.features[-1][3]  # close price
-        recent_data = request.features[-10:]  # last 10 days
-        
-        # Calculate volatility from historical data
-        closes = [d[3] for d in recent_data]
-        returns = [(closes[i] - closes[i-1]) / closes[i-1] for i in range(1, len(closes))]
-        volatility = np.std(returns) if returns else 0.02
-        
-        # Determine trend based on momentum
-        sma_5 = np.mean(closes[-5:]) if len(closes) >= 5 else last_price
-        sma_10 = np.mean(closes[-10:]) if len(closes) >= 10 else last_price
-        
-        if sma_5 > sma_10 * 1.01:
-            base_trend = 0.001  # Slight upward bias
-            trend_name = "bullish"
-        elif sma_5 < sma_10 * 0.99:
-            base_trend = -0.001  # Slight downward bias
-            trend_name = "bearish"
-        else:
-            base_trend = 0.0
-            trend_name = "neutral"
-        
-        # Generate predictions with mean reversion and momentum
-        predictions = []
-        confidence_scores = []
-        current_price = last_price
-        
-        for day in range(request.days_to_predict):
-            # Random walk with drift
-            random_component = random.gauss(0, volatility)
-            drift = base_trend * (1 - day * 0.05)  # Decaying momentum
-            
-            # Mean reversion factor (prices tend to revert to mean)
-            mean_price = np.mean(closes)
-            reversion_strength = 0.02 * (day / request.days_to_predict)
-            reversion = (mean_price - current_price) / current_price * reversion_strength
-            
-            total_change = drift + random_component + reversion
-            current_price *= (1 + total_change)
-            
-            predictions.append(round(max(current_price, 0.01), 2))
-            
-            # Confidence decreases with prediction horizon
-            confidence = max(0.45, 0.92 - (day * 0.06))
-            confidence_scores.append(round(confidence, 2))
-        
-        # Calculate statistics
-        price_change = ((predictions[-1] - last_price) / last_price) * 100
-        predicted_high = max(predictions)
-        predicted_low = min(predictions)
-        
-        # Refine trend based on final prediction
-        if price_change > 3:
-            trend_name = "bullish"
-        elif price_change < -3:
-            trend_name = "bearish"
-        
-        logger.info(f"Prediction complete for {request.symbol}: {trend_name}")
-        
-        return PredictionResponse(
-            symbol=request.symbol.upper(),
-            predictions=predictions,
-            confidence_scores=confidence_scores,
-            trend=trend_name,
-            current_price=round(last_price, 2),
-            predicted_change_percent=round(price_change, 2),
-            predicted_high=round(predicted_high, 2),
-            predicted_low=round(predicted_low, 2),
-            generated_at=datetime.now().isoformat(),
-            model_version="lstm-cloud-v1.0"
-        )
+        return run_lstm_prediction(request.symbol, request.features, request.days_to_predict)
         
     except Exception as e:
         logger.error(f"Prediction error: {str(e)}")
@@ -317,76 +475,7 @@ async def analyze_sentiment(request: SentimentRequest):
     Uses keyword-based analysis (upgrade to FinBERT for production).
     """
     try:
-        logger.info(f"Sentiment analysis for {request.symbol or 'general'}")
-        
-        if not request.texts:
-            raise HTTPException(status_code=400, detail="No texts provided")
-        
-        sentiments = []
-        total_score = 0
-        bullish_count = 0
-        bearish_count = 0
-        neutral_count = 0
-        
-        for text in request.texts:
-            text_lower = text.lower()
-            keywords = analyze_keywords(text)
-            
-            # Scoring system
-            positive_score = sum(1 for k in keywords if k in ["profit", "growth", "surge", "bull", "rally", "gain", "record", "beat", "strong", "outperform"])
-            negative_score = sum(1 for k in keywords if k in ["loss", "crash", "bear", "decline", "drop", "weak", "miss", "recession", "underperform", "fall"])
-            
-            # Calculate sentiment score (-1 to 1)
-            if positive_score > negative_score:
-                label = "positive"
-                score = min(0.95, 0.6 + (positive_score - negative_score) * 0.1)
-                bullish_count += 1
-            elif negative_score > positive_score:
-                label = "negative"
-                score = min(0.95, 0.6 + (negative_score - positive_score) * 0.1)
-                bearish_count += 1
-            else:
-                label = "neutral"
-                score = 0.5
-                neutral_count += 1
-            
-            # Adjust score sign based on label
-            sentiment_value = score if label == "positive" else -score if label == "negative" else 0
-            total_score += sentiment_value
-            
-            sentiments.append(SentimentItem(
-                text=text[:100] + "..." if len(text) > 100 else text,
-                label=label,
-                score=round(score, 3),
-                keywords=keywords
-            ))
-        
-        # Calculate overall metrics
-        avg_score = total_score / len(request.texts)
-        
-        if avg_score > 0.25:
-            overall_label = "positive"
-            recommendation = "buy"
-        elif avg_score < -0.25:
-            overall_label = "negative"
-            recommendation = "sell"
-        else:
-            overall_label = "neutral"
-            recommendation = "hold"
-        
-        confidence = abs(avg_score)
-        
-        return SentimentResponse(
-            symbol=request.symbol.upper() if request.symbol else None,
-            sentiments=sentiments,
-            overall_score=round(avg_score, 3),
-            overall_label=overall_label,
-            recommendation=recommendation,
-            confidence=round(confidence, 3),
-            bullish_count=bullish_count,
-            bearish_count=bearish_count,
-            neutral_count=neutral_count
-        )
+        return run_sentiment_analysis(request.texts, request.symbol)
         
     except Exception as e:
         logger.error(f"Sentiment error: {str(e)}")
@@ -492,4 +581,99 @@ async def get_market_overview():
         "indices": indices,
         "timestamp": datetime.now().isoformat(),
         "market_status": "open" if 9 <= datetime.now().hour < 16 else "closed"
-    }
\ No newline at end of file
+    }
+
+@router.post("/batch", response_model=BatchResponse, tags=["Batch"])
+async def run_batch(request: BatchRequest):
+    """
+    Batch Operations
+    
+    Runs many predict / indicators / sentiment operations in one round-trip.
+    OHLCV series are sent once per symbol and shared by every operation,
+    identical operations are executed only once, and all work runs
+    concurrently under a single deadline. Operations still running when
+    the deadline expires are reported with status "timeout".
+    
+    With `stream=true` results are returned as NDJSON in completion order.
+    """
+    started = time.monotonic()
+    deadline = started + request.timeout_ms / 1000
+    series = {symbol.upper(): data for symbol, data in request.series.items()}
+    
+    # Group operations by identity so duplicates share one execution
+    groups: Dict[Tuple, List[Tuple[int, BatchOperation]]] = {}
+    for index, op in enumerate(request.operations):
+        groups.setdefault(batch_operation_key(op), []).append((index, op))
+    
+    logger.info(
+        f"Batch request: {len(request.operations)} operations, {len(groups)} unique"
+    )
+    
+    tasks = {
+        asyncio.ensure_future(run_in_threadpool(run_batch_operation, members[0][1], series)): key
+        for key, members in groups.items()
+    }
+    
+    def build_results(key: Tuple, task: Optional[asyncio.Future]) -> List[Tuple[int, BatchResult]]:
+        if task is None:
+            status, result, error = "timeout", None, f"Deadline of {request.timeout_ms}ms exceeded"
+        elif task.exception() is not None:
+            exc = task.exception()
+            status, result = "error", None
+            error = exc.detail if isinstance(exc, HTTPException) else str(exc)
+            logger.error(f"Batch operation {key[0]} failed: {error}")
+        else:
+            status, result, error = "ok", task.result(), None
+        
+        return [
+            (index, BatchResult(
+                id=op.id or str(index),
+                type=op.type,
+                symbol=op.symbol.upper() if op.symbol else None,
+                status=status,
+                result=result,
+                error=error
+            ))
+            for index, op in groups[key]
+        ]
+    
+    async def completed_results():
+        pending = set(tasks)
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(
+                pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield build_results(tasks[task], task)
+        
+        # Worker threads cannot be interrupted; stop waiting and report the rest
+        for task in pending:
+            task.cancel()
+            yield build_results(tasks[task], None)
+    
+    if request.stream:
+        async def ndjson_stream():
+            async for entries in completed_results():
+                for _, entry in entries:
+                    yield entry.model_dump_json() + "\n"
+        
+        return StreamingResponse(ndjson_stream(), media_type="application/x-ndjson")
+    
+    indexed = []
+    async for entries in completed_results():
+        indexed.extend(entries)
+    results = [entry for _, entry in sorted(indexed, key=lambda item: item[0])]
+    
+    return BatchResponse(
+        results=results,
+        total_operations=len(request.operations),
+        unique_operations=len(groups),
+        succeeded=sum(1 for r in results if r.status == "ok"),
+        failed=sum(1 for r in results if r.status == "error"),
+        timed_out=sum(1 for r in results if r.status == "timeout"),
+        elapsed_ms=int((time.monotonic() - started) * 1000),
+        generated_at=datetime.now().isoformat()
+    )
\ No newline at end of file
@@ -21,6 +21,7 @@ app = FastAPI(
     * **LSTM Predictions**: Cloud-based complex price forecasting
     * **Sentiment Analysis**: News sentiment using ML models
     * **Mock Data**: Fallback when APIs are rate-limited
+    * **Batch**: Many predict/indicator/sentiment operations in one round-trip
     * **Health Monitoring**: System status and diagnostics
     
     ## Hybrid Approach
@@ -58,7 +59,8 @@ async def root():
             "prediction": "/api/v1/predict/lstm",
             "sentiment": "/api/v1/analyze/sentiment",
             "mock_data": "/api/v1/mock/stock/{symbol}",
-            "technical_indicators": "/api/v1/indicators/calculate"
+            "technical_indicators": "/api/v1/indicators/calculate",
+            "batch": "/api/v1/batch"
         },
         "status": "operational"
     }